@@ -1,9 +1,10 @@
 """Config flow for OpenAI text-to-speech custom component."""
 from __future__ import annotations
 from typing import Any
+import functools
 import voluptuous as vol
 import logging
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
 from homeassistant import data_entry_flow
 from homeassistant.config_entries import ConfigFlow
@@ -14,28 +15,27 @@ from .const import CONF_API_KEY, CONF_MODEL, CONF_VOICE, CONF_SPEED, CONF_URL, D
 
 _LOGGER = logging.getLogger(__name__)
 
-def generate_unique_id(user_input: dict) -> str:
-    """Generate a unique id from user input."""
-    url = urlparse(user_input[CONF_URL])
-    return f"{url.hostname}_{user_input[CONF_MODEL]}_{user_input[CONF_VOICE]}"
+def generate_unique_id(hostname: str | None, user_input: dict) -> str:
+    """Generate a unique id from the endpoint hostname and user input."""
+    return f"{hostname}_{user_input[CONF_MODEL]}_{user_input[CONF_VOICE]}"
 
-async def validate_user_input(user_input: dict):
+def validate_user_input(user_input: dict) -> None:
     """Validate user input fields."""
-    if user_input.get(CONF_MODEL) is None:
+    if not user_input.get(CONF_MODEL):
         raise ValueError("Model is required")
-    if user_input.get(CONF_VOICE) is None:
+    if not user_input.get(CONF_VOICE):
         raise ValueError("Voice is required")
 
-class OpenAITTSConfigFlow(ConfigFlow, domain=DOMAIN):
-    """Handle a config flow for OpenAI TTS."""
-    VERSION = 1
-    data_schema = vol.Schema({
+@functools.cache
+def get_data_schema() -> vol.Schema:
+    """Build the user step schema on first use."""
+    return vol.Schema({
         vol.Optional(CONF_API_KEY): str,
         vol.Optional(CONF_URL, default="https://api.openai.com/v1/audio/speech"): str,
         vol.Optional(CONF_SPEED, default=1.0): vol.Coerce(float),
         vol.Required(CONF_MODEL, default="tts-1"): selector({
             "select": {
-                "options": MODELS,
+                "options": list(MODELS),
                 "mode": "dropdown",
                 "sort": True,
                 "custom_value": True
@@ -43,7 +43,7 @@ class OpenAITTSConfigFlow(ConfigFlow, domain=DOMAIN):
         }),
         vol.Required(CONF_VOICE, default="shimmer"): selector({
             "select": {
-                "options": VOICES,
+                "options": list(VOICES),
                 "mode": "dropdown",
                 "sort": True,
                 "custom_value": True
@@ -51,27 +51,31 @@ class OpenAITTSConfigFlow(ConfigFlow, domain=DOMAIN):
         })
     })
 
+class OpenAITTSConfigFlow(ConfigFlow, domain=DOMAIN):
+    """Handle a config flow for OpenAI TTS."""
+    VERSION = 1
+
     async def async_step_user(self, user_input: dict[str, Any] | None = None):
         """Handle the initial step."""
         errors = {}
         if user_input is not None:
             try:
-                await validate_user_input(user_input)
-                unique_id = generate_unique_id(user_input)
+                validate_user_input(user_input)
+                hostname = urlsplit(user_input[CONF_URL]).hostname
+                unique_id = generate_unique_id(hostname, user_input)
                 user_input[UNIQUE_ID] = unique_id
                 await self.async_set_unique_id(unique_id)
                 self._abort_if_unique_id_configured()
-                hostname = urlparse(user_input[CONF_URL]).hostname
                 return self.async_create_entry(title=f"OpenAI TTS ({hostname}, {user_input[CONF_MODEL]}, {user_input[CONF_VOICE]})", data=user_input)
             except data_entry_flow.AbortFlow:
                 return self.async_abort(reason="already_configured")
             except HomeAssistantError as e:
-                _LOGGER.exception(str(e))
+                _LOGGER.error("%s", e)
                 errors["base"] = str(e)
             except ValueError as e:
-                _LOGGER.exception(str(e))
+                _LOGGER.error("%s", e)
                 errors["base"] = str(e)
             except Exception as e:  # pylint: disable=broad-except
-                _LOGGER.exception(str(e))
+                _LOGGER.exception("Unexpected error: %s", e)
                 errors["base"] = "unknown_error"
-        return self.async_show_form(step_id="user", data_schema=self.data_schema, errors=errors, description_placeholders=user_input)
+        return self.async_show_form(step_id="user", data_schema=get_data_schema(), errors=errors)
@@ -7,5 +7,6 @@ CONF_VOICE = 'voice'
 CONF_SPEED = 'speed'
 CONF_URL = 'url'
 UNIQUE_ID = 'unique_id'
-MODELS = ["tts-1", "tts-1-hd"]
-VOICES = ["alloy", "echo", "fable", "onyx", "nova", "shimmer"]
+MODELS = ("tts-1", "tts-1-hd")
+VOICES = ("alloy", "echo", "fable", "onyx", "nova", "shimmer")
+SUPPORTED_LANGUAGES = ("af", "ar", "hy", "az", "be", "bs", "bg", "ca", "zh", "hr", "cs", "da", "nl", "en", "et", "fi", "fr", "gl", "de", "el", "he", "hi", "hu", "is", "id", "it", "ja", "kn", "kk", "ko", "lv", "lt", "mk", "ms", "mr", "mi", "ne", "no", "fa", "pl", "pt", "ro", "ru", "sr", "sk", "sl", "es", "sw", "sv", "tl", "ta", "th", "tr", "uk", "ur", "vi", "cy")
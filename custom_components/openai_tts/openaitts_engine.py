@@ -1,5 +1,10 @@
 import requests
 
+from .const import SUPPORTED_LANGUAGES
+
+# (connect, read) timeouts in seconds; the read budget covers synthesis of long inputs
+TIMEOUT = (5, 30)
+
 class OpenAITTSEngine:
 
     def __init__(self, api_key: str, voice: str, model: str, speed: int, url: str):
@@ -8,20 +13,26 @@ class OpenAITTSEngine:
         self._model = model
         self._speed = speed
         self._url = url
+        self._session = requests.Session()
+        if api_key:
+            self._session.headers["Authorization"] = f"Bearer {api_key}"
+        self._payload: dict = {
+            "model": model,
+            "voice": voice,
+            "response_format": "wav",
+            "speed": speed
+        }
 
     def get_tts(self, text: str):
         """ Makes request to OpenAI TTS engine to convert text into audio"""
-        headers: dict = {"Authorization": f"Bearer {self._api_key}"} if self._api_key else {}
-        data: dict = {
-            "model": self._model,
-            "input": text,
-            "voice": self._voice,
-            "response_format": "wav",
-            "speed": self._speed
-        }
-        return requests.post(self._url, headers=headers, json=data)
+        data: dict = {**self._payload, "input": text}
+        return self._session.post(self._url, json=data, timeout=TIMEOUT)
+
+    def close(self):
+        """ Closes the pooled connections to the TTS endpoint"""
+        self._session.close()
 
     @staticmethod
-    def get_supported_langs() -> list:
+    def get_supported_langs() -> tuple:
         """Returns list of supported languages. Note: the model determines the provides language automatically."""
-        return ["af", "ar", "hy", "az", "be", "bs", "bg", "ca", "zh", "hr", "cs", "da", "nl", "en", "et", "fi", "fr", "gl", "de", "el", "he", "hi", "hu", "is", "id", "it", "ja", "kn", "kk", "ko", "lv", "lt", "mk", "ms", "mr", "mi", "ne", "no", "fa", "pl", "pt", "ro", "ru", "sr", "sk", "sl", "es", "sw", "sv", "tl", "ta", "th", "tr", "uk", "ur", "vi", "cy"]
+        return SUPPORTED_LANGUAGES
@@ -20,16 +20,14 @@ async def async_setup_entry(
 ) -> None:
     """Set up OpenAI Text-to-speech platform via config entry."""
 
-    api_key = None
-    if CONF_API_KEY in config_entry.data:
-        api_key = config_entry.data[CONF_API_KEY]
+    data = config_entry.data
 
     engine = OpenAITTSEngine(
-        api_key,
-        config_entry.data[CONF_VOICE],
-        config_entry.data[CONF_MODEL],
-        config_entry.data[CONF_SPEED],
-        config_entry.data[CONF_URL]
+        data.get(CONF_API_KEY),
+        data[CONF_VOICE],
+        data[CONF_MODEL],
+        data[CONF_SPEED],
+        data[CONF_URL]
     )
     async_add_entities([OpenAITTSEntity(hass, config_entry, engine)])
 
@@ -51,6 +49,10 @@ class OpenAITTSEntity(TextToSpeechEntity):
             self._attr_unique_id = f"{config.data[CONF_VOICE]}_{config.data[CONF_MODEL]}"
         self.entity_id = generate_entity_id("tts.openai_tts_{}", config.data[CONF_VOICE], hass=hass)
 
+    async def async_will_remove_from_hass(self) -> None:
+        """Release the engine's pooled connections."""
+        self._engine.close()
+
     @property
     def default_language(self):
         """Return the default language."""